@@ -2,6 +2,8 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Dict, Any
+import os
+import anyio.to_thread
 import uvicorn
 
 from ner_system import LocationNER
@@ -22,6 +24,9 @@ ner_system = None
 class TextRequest(BaseModel):
     text: str
 
+class BatchRequest(BaseModel):
+    texts: List[str]
+
 class EntityResponse(BaseModel):
     entity: str
     type: str
@@ -35,9 +40,15 @@ class NERResponse(BaseModel):
     entities: List[Dict[str, Any]]
     status: str = "success"
 
+class BatchNERResponse(BaseModel):
+    results: List[NERResponse]
+    status: str = "success"
+
 @app.on_event("startup")
 async def startup_event():
     global ner_system
+    # Allow more concurrent /analyze calls to run in the threadpool
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 64
     print("Loading NER system...")
     try:
         ner_system = LocationNER()
@@ -50,35 +61,68 @@ async def startup_event():
 async def read_root():
     return {"message": "Location NER API is running. Use /analyze endpoint to analyze text."}
 
+def _analyze_single(text: str) -> NERResponse:
+    entities = ner_system.extract_entities(text)
+
+    filtered_entities = []
+    for entity in entities:
+        if entity['entity'].strip():
+            filtered_entities.append({
+                'entity': entity['entity'],
+                'type': entity['type'],
+                'source': entity['source'],
+                'match': entity['match'],
+                'score': entity['score']
+            })
+
+    return NERResponse(
+        text=text,
+        entities=filtered_entities
+    )
+
 @app.post("/analyze", response_model=NERResponse)
-async def analyze_text(request: TextRequest):
+def analyze_text(request: TextRequest):
+    # Plain def so FastAPI runs the CPU-bound extraction in its threadpool
+    # instead of blocking the event loop
     if not ner_system:
         raise HTTPException(status_code=503, detail="NER system not initialized")
-    
+
+    text = request.text.strip()
+    if not text:
+        raise HTTPException(status_code=400, detail="Text cannot be empty")
+
     try:
-        text = request.text.strip()
-        if not text:
-            raise HTTPException(status_code=400, detail="Text cannot be empty")
-        
-        entities = ner_system.extract_entities(text)
-        
-        filtered_entities = []
-        for entity in entities:
-            if entity['entity'].strip():
-                filtered_entities.append({
-                    'entity': entity['entity'],
-                    'type': entity['type'],
-                    'source': entity['source'],
-                    'match': entity['match'],
-                    'score': entity['score']
-                })
-        
-        return NERResponse(
-            text=text,
-            entities=filtered_entities
-        )
+        return _analyze_single(text)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/analyze_batch", response_model=BatchNERResponse)
+def analyze_batch(request: BatchRequest):
+    # One request (and one threadpool hop) for many small texts
+    if not ner_system:
+        raise HTTPException(status_code=503, detail="NER system not initialized")
+
+    texts = [text.strip() for text in request.texts]
+    if not all(texts):
+        raise HTTPException(status_code=400, detail="Texts cannot be empty")
+
+    try:
+        return BatchNERResponse(results=[_analyze_single(text) for text in texts])
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 if __name__ == "__main__":
-    uvicorn.run("api:app", host="0.0.0.0", port=8000, reload=True)
+    if os.environ.get("NER_API_DEV"):
+        # Dev mode: auto-reload (forces a single worker and the default loop)
+        uvicorn.run("api:app", host="0.0.0.0", port=8000, reload=True)
+    else:
+        uvicorn.run(
+            "api:app",
+            host="0.0.0.0",
+            port=8000,
+            loop="uvloop",
+            http="httptools",
+            workers=os.cpu_count(),
+            limit_concurrency=1024,
+            backlog=2048,
+        )
@@ -1,21 +1,91 @@
 import json
+import os
+import pickle
+import re
 from typing import List, Dict, Tuple, Set
-from fuzzywuzzy import fuzz
+import ahocorasick
+import numpy as np
+from numba import njit
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Levenshtein
 from collections import defaultdict
+from functools import lru_cache
+
+# Integer codes for token types and sources so the per-token passes can
+# run over numpy arrays instead of per-word dicts
+TYPE_UNKNOWN, TYPE_LOC, TYPE_TYPE, TYPE_NAME = 0, 1, 2, 3
+SOURCE_UNMATCHED, SOURCE_EXACT, SOURCE_FUZZY, SOURCE_LOC_BEFORE_TYPE, SOURCE_UNMATCHED_TEXT = 0, 1, 2, 3, 4
+
+_TYPE_CODES = {'UNKNOWN': TYPE_UNKNOWN, 'LOC': TYPE_LOC, 'TYPE': TYPE_TYPE, 'NAME': TYPE_NAME}
+_TYPE_LABELS = {code: label for label, code in _TYPE_CODES.items()}
+_SOURCE_CODES = {
+    'unmatched': SOURCE_UNMATCHED,
+    'exact_match': SOURCE_EXACT,
+    'fuzzy_match': SOURCE_FUZZY,
+    'loc_before_type': SOURCE_LOC_BEFORE_TYPE,
+    'unmatched_text': SOURCE_UNMATCHED_TEXT,
+}
+_SOURCE_LABELS = {code: label for label, code in _SOURCE_CODES.items()}
+
+# Whitespace-separated tokens with their character offsets for free
+_TOKEN_RE = re.compile(r'\S+')
+
+
+@njit(cache=True)
+def _finalize_types(types, sources):
+    """Relabel LOC-before-TYPE and leftover UNKNOWN tokens as NAME in place."""
+    for i in range(types.size - 1):
+        if types[i] == TYPE_LOC and types[i + 1] == TYPE_TYPE:
+            types[i] = TYPE_NAME
+            sources[i] = SOURCE_LOC_BEFORE_TYPE
+    for i in range(types.size):
+        if types[i] == TYPE_UNKNOWN:
+            types[i] = TYPE_NAME
+            sources[i] = SOURCE_UNMATCHED_TEXT
+
+
+@njit(cache=True)
+def _combine_runs(types, sources, starts, ends):
+    """Return the start index of every run of adjacent same-type, same-source tokens."""
+    n = types.size
+    run_starts = np.empty(n, dtype=np.int64)
+    count = 0
+    for i in range(n):
+        if (i == 0 or types[i] != types[i - 1] or sources[i] != sources[i - 1]
+                or starts[i] != ends[i - 1] + 1):
+            run_starts[count] = i
+            count += 1
+    return run_starts[:count]
 
 class LocationNER:
+    CACHE_FILE = 'gazetteer.cache'
+    # Bump when the cached structure layout changes so stale caches rebuild
+    CACHE_VERSION = 2
+
     def __init__(self, fuzzy_threshold: int = 90):
-        self.locations = self._load_json('places.json')
-        self.types = self._load_json('type.json')
-        
-        self.locations_set = set(loc.lower() for loc in self.locations)
-        self.types_set = set(t.lower() for t in self.types)
-        
-        # Create a dictionary of first two letters to possible matches for faster fuzzy matching
-        self.locations_index = self._build_fuzzy_index(self.locations)
-        self.types_index = self._build_fuzzy_index(self.types)
-        
+        if not self._load_cached_gazetteer():
+            self.locations = self._load_json('places.json')
+            self.types = self._load_json('type.json')
+
+            # Frozen for faster hashing on the exact-match (distance-0) fast path
+            self.locations_set = frozenset(loc.lower() for loc in self.locations)
+            self.types_set = frozenset(t.lower() for t in self.types)
+
+            # Create a dictionary of first two letters to possible matches for faster fuzzy matching
+            self.locations_index = self._build_fuzzy_index(self.locations)
+            self.types_index = self._build_fuzzy_index(self.types)
+
+            # Aho-Corasick automaton over all phrases for single-pass exact matching
+            self.ac = self._build_automaton()
+
+            self._save_cached_gazetteer()
+
+
         self.fuzzy_threshold = fuzzy_threshold  # Default threshold of 90% similarity
+
+        # Memoize full extraction results for repeated queries; cached
+        # entity lists are treated as read-only by callers
+        self.extract_entities = lru_cache(maxsize=4096)(self.extract_entities)
         
         # Model loading removed as we're using exact matching
     
@@ -23,36 +93,140 @@ class LocationNER:
         """Load JSON file containing locations or types."""
         with open(filename, 'r', encoding='utf-8') as f:
             return json.load(f)
+
+    def _source_mtimes(self) -> Tuple[float, float]:
+        """Modification times of the gazetteer source files."""
+        return (os.path.getmtime('places.json'), os.path.getmtime('type.json'))
+
+    def _load_cached_gazetteer(self) -> bool:
+        """Load the pickled gazetteer artifact if it is still up to date.
+
+        The normalized sets, fuzzy indexes and automaton are expensive to
+        rebuild on every process start, so they are deserialized in one go
+        when the source JSON files have not changed.
+        """
+        try:
+            with open(self.CACHE_FILE, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('version') != self.CACHE_VERSION:
+                return False
+            if cached['mtimes'] != self._source_mtimes():
+                return False
+            self.locations = cached['locations']
+            self.types = cached['types']
+            self.locations_set = cached['locations_set']
+            self.types_set = cached['types_set']
+            self.locations_index = cached['locations_index']
+            self.types_index = cached['types_index']
+            self.ac = cached['automaton']
+        except (OSError, pickle.PickleError, KeyError, EOFError, AttributeError):
+            return False
+        return True
+
+    def _save_cached_gazetteer(self) -> None:
+        """Write the built gazetteer structures to the cache file."""
+        payload = {
+            'version': self.CACHE_VERSION,
+            'mtimes': self._source_mtimes(),
+            'locations': self.locations,
+            'types': self.types,
+            'locations_set': self.locations_set,
+            'types_set': self.types_set,
+            'locations_index': self.locations_index,
+            'types_index': self.types_index,
+            'automaton': self.ac,
+        }
+        tmp_file = self.CACHE_FILE + '.tmp'
+        try:
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.CACHE_FILE)
+        except OSError:
+            # The cache is an optimization only; run without it
+            pass
     
+    def _build_automaton(self) -> ahocorasick.Automaton:
+        """Build an Aho-Corasick automaton over all lowercased phrases.
+
+        Locations are added after types so they take precedence when a
+        phrase appears in both lists, matching the lookup order elsewhere.
+        """
+        automaton = ahocorasick.Automaton()
+        for phrase in self.types_set:
+            automaton.add_word(phrase, ('TYPE', phrase))
+        for phrase in self.locations_set:
+            automaton.add_word(phrase, ('LOC', phrase))
+        automaton.make_automaton()
+        return automaton
+
+    def _scan_phrases(self, lower_text: str) -> List[Tuple[int, int, str]]:
+        """Single-pass automaton scan returning (start, end, label) matches.
+
+        Only matches aligned on whitespace boundaries are kept, and
+        overlapping matches are resolved in favour of the longest one
+        starting earliest.
+        """
+        n = len(lower_text)
+        raw = []
+        for end_index, (label, phrase) in self.ac.iter(lower_text):
+            start = end_index - len(phrase) + 1
+            end = end_index + 1
+            if start > 0 and not lower_text[start - 1].isspace():
+                continue
+            if end < n and not lower_text[end].isspace():
+                continue
+            raw.append((start, end, label))
+
+        # Longest match first at each position, then drop overlaps
+        raw.sort(key=lambda m: (m[0], m[0] - m[1]))
+        selected = []
+        last_end = 0
+        for start, end, label in raw:
+            if start >= last_end:
+                selected.append((start, end, label))
+                last_end = end
+        return selected
+
+    def _iter_tokens(self, text: str, start: int, end: int):
+        """Yield (word, start, end) for whitespace-separated tokens in text[start:end]."""
+        for m in _TOKEN_RE.finditer(text, start, end):
+            yield m.group(), m.start(), m.end()
+
     def _find_phrases(self, text: str, word_list: set, label: str) -> List[Dict]:
         """Find exact whole word matches in text from a given word list."""
-        words = text.split()
+        lower_text = text.lower()
+
+        # Tokenize with offsets in one pass, instead of re-searching the
+        # text for every candidate phrase
+        words = []
+        offsets = []
+        for m in _TOKEN_RE.finditer(text):
+            words.append(m.group())
+            offsets.append((m.start(), m.end()))
+
         matches = []
-        
+        matched = [False] * len(words)
+
         # First check for multi-word phrases (longer matches first)
         for phrase_length in range(3, 0, -1):  # Check 3-word, then 2-word, then 1-word phrases
             for i in range(len(words) - phrase_length + 1):
-                # Get the phrase with original case for the match
-                phrase = ' '.join(words[i:i+phrase_length])
-                phrase_lower = phrase.lower()
-                
+                if any(matched[i:i+phrase_length]):
+                    continue
+
+                start = offsets[i][0]
+                end = offsets[i + phrase_length - 1][1]
+
                 # Check if this phrase exists in our word list (case-insensitive)
-                if phrase_lower in word_list:
-                    # Find the exact case in the original text
-                    start = text.lower().find(phrase_lower)
-                    if start != -1:
-                        end = start + len(phrase)
-                        original_phrase = text[start:end]
-                        
-                        matches.append({
-                            'entity': original_phrase,
-                            'type': label,
-                            'start': start,
-                            'end': end
-                        })
-                        
-                        text = text[:start] + (' ' * (end - start)) + text[end:]
-        
+                if lower_text[start:end] in word_list:
+                    matches.append({
+                        'entity': text[start:end],
+                        'type': label,
+                        'start': start,
+                        'end': end
+                    })
+                    for j in range(i, i + phrase_length):
+                        matched[j] = True
+
         return matches
     
     def extract_entities(self, text: str) -> List[Dict]:
@@ -62,194 +236,190 @@ class LocationNER:
         2. Any word not in type or location is a name
         3. If location comes before type, they are both part of a name
         """
-        # First, try to find multi-word locations (up to 3 words) before splitting into individual words
-        words = []
-        word_list = text.split()
-        i = 0
-        n = len(word_list)
-        
-        while i < n:
-            # Try to match the longest possible phrase first (up to 3 words)
-            matched = False
-            for j in range(min(3, n - i), 0, -1):
-                phrase = ' '.join(word_list[i:i+j]).lower()
-                if phrase in self.locations_set:
-                    # Found a multi-word location
-                    phrase_text = ' '.join(word_list[i:i+j])
-                    start = text.find(phrase_text, i)
-                    end = start + len(phrase_text)
-                    words.append({
-                        'text': phrase_text,
-                        'start': start,
-                        'end': end,
-                        'type': 'LOC',
-                        'source': 'exact_match',
-                        'match': phrase_text,
-                        'score': 100
-                    })
-                    i += j
-                    matched = True
-                    break
-                elif phrase in self.types_set:
-                    # Found a multi-word type
-                    phrase_text = ' '.join(word_list[i:i+j])
-                    start = text.find(phrase_text, i)
-                    end = start + len(phrase_text)
-                    words.append({
-                        'text': phrase_text,
-                        'start': start,
-                        'end': end,
-                        'type': 'TYPE',
-                        'source': 'exact_match',
-                        'match': phrase_text,
-                        'score': 100
-                    })
-                    i += j
-                    matched = True
-                    break
-            
-            if not matched:
-                # No multi-word match found, add as single word
-                word = word_list[i]
-                start = text.find(word, i)
-                end = start + len(word)
-                words.append({
-                    'text': word,
-                    'start': start,
-                    'end': end,
-                    'type': 'UNKNOWN',
-                    'source': 'unmatched',
-                    'match': '',
-                    'score': 0
-                })
-                i += 1
-        
-        # Now process any remaining UNKNOWN words as single words
-        for word in words:
-            if word['type'] == 'UNKNOWN':
-                word_lower = word['text'].lower()
+        # Per-token attributes live in parallel columns (SoA) instead of a
+        # dict per word, so the later passes stay on flat arrays
+        lower_text = text.lower()
+        texts: List[str] = []
+        tok_starts: List[int] = []
+        tok_ends: List[int] = []
+        type_codes: List[int] = []
+        source_codes: List[int] = []
+        match_words: List[str] = []
+        match_scores: List[float] = []
+
+        # Classification results per distinct token, so repeated tokens
+        # are only looked up once per call
+        token_cache: Dict[str, Tuple[int, int, str, float]] = {}
+
+        def classify_word(word_lower: str) -> Tuple[int, int, str, float]:
+            """Classify a single word not covered by a phrase match."""
+            cached = token_cache.get(word_lower)
+            if cached is None:
                 if word_lower in self.locations_set:
-                    word['type'] = 'LOC'
-                    word['source'] = 'exact_match'
-                    word['match'] = word_lower
-                    word['score'] = 100
+                    cached = (TYPE_LOC, SOURCE_EXACT, word_lower, 100)
                 elif word_lower in self.types_set:
-                    word['type'] = 'TYPE'
-                    word['source'] = 'exact_match'
-                    word['match'] = word_lower
-                    word['score'] = 100
+                    cached = (TYPE_TYPE, SOURCE_EXACT, word_lower, 100)
                 else:
-                    # Check for fuzzy matches
-                    loc_matches = self._get_fuzzy_matches(word_lower, self.locations_set, self.locations_index)
-                    type_matches = self._get_fuzzy_matches(word_lower, self.types_set, self.types_index)
-                    
-                    if loc_matches:
-                        best_match = max(loc_matches, key=lambda x: fuzz.ratio(word_lower, x))
-                        word['type'] = 'LOC'
-                        word['source'] = 'fuzzy_match'
-                        word['match'] = best_match
-                        word['score'] = fuzz.ratio(word_lower, best_match)
-                    elif type_matches:
-                        best_match = max(type_matches, key=lambda x: fuzz.ratio(word_lower, x))
-                        word['type'] = 'TYPE'
-                        word['source'] = 'fuzzy_match'
-                        word['match'] = best_match
-                        word['score'] = fuzz.ratio(word_lower, best_match)
-        
-        # Second pass: Handle LOC followed by TYPE
-        # Any LOC that comes before a TYPE should be marked as NAME
-        i = 0
-        while i < len(words) - 1:
-            current = words[i]
-            next_word = words[i + 1]
-            
-            # If current is LOC and next is TYPE, mark current as NAME
-            if current['type'] == 'LOC' and next_word['type'] == 'TYPE':
-                if current.get('source') == 'unmatched':
-                    current['source'] = 'unmatched_text'
-                    current['match'] = ''
-                    current['score'] = 0
-                current['type'] = 'NAME'
-                current['source'] = 'loc_before_type'
-            i += 1
-        
-        # Third pass: Mark remaining UNKNOWN as NAME
-        for word in words:
-            if word['type'] == 'UNKNOWN':
-                word['type'] = 'NAME'
-                word['source'] = 'unmatched_text'
-                word['match'] = ''
-                word['score'] = 0
-        
-        # Combine adjacent same-type words
+                    loc_match, loc_score = self._get_best_fuzzy_match(word_lower, self.locations_set, self.locations_index)
+                    if loc_match:
+                        cached = (TYPE_LOC, SOURCE_FUZZY, loc_match, loc_score)
+                    else:
+                        type_match, type_score = self._get_best_fuzzy_match(word_lower, self.types_set, self.types_index)
+                        if type_match:
+                            cached = (TYPE_TYPE, SOURCE_FUZZY, type_match, type_score)
+                        else:
+                            cached = (TYPE_UNKNOWN, SOURCE_UNMATCHED, '', 0)
+                token_cache[word_lower] = cached
+            return cached
+
+        # Find exact phrase matches (any length) in a single automaton
+        # pass; tokens between matches are classified inline, so every
+        # token is finalized in this one pass
+        pos = 0
+        for start, end, label in self._scan_phrases(lower_text) + [(len(text), len(text), None)]:
+            for word, word_start, word_end in self._iter_tokens(text, pos, start):
+                type_code, source_code, match_word, match_score = classify_word(word.lower())
+                texts.append(word)
+                tok_starts.append(word_start)
+                tok_ends.append(word_end)
+                type_codes.append(type_code)
+                source_codes.append(source_code)
+                match_words.append(match_word)
+                match_scores.append(match_score)
+
+            if label is not None:
+                texts.append(text[start:end])
+                tok_starts.append(start)
+                tok_ends.append(end)
+                type_codes.append(_TYPE_CODES[label])
+                source_codes.append(SOURCE_EXACT)
+                match_words.append(text[start:end])
+                match_scores.append(100)
+            pos = end
+
+        if not texts:
+            return []
+
+        starts = np.array(tok_starts, dtype=np.int32)
+        ends = np.array(tok_ends, dtype=np.int32)
+        types = np.array(type_codes, dtype=np.int8)
+        sources = np.array(source_codes, dtype=np.int8)
+
+        # Relabel LOC-before-TYPE and leftover UNKNOWN as NAME, then
+        # combine adjacent same-type, same-source tokens into entities
+        _finalize_types(types, sources)
+        run_starts = _combine_runs(types, sources, starts, ends)
+
+        n_words = len(texts)
         combined_entities = []
-        if words:
-            current_entity = dict(words[0])
-            
-            for word in words[1:]:
-                # If same type and adjacent, merge
-                if (word['type'] == current_entity['type'] and 
-                    word['source'] == current_entity['source'] and
-                    word['start'] == current_entity['end'] + 1):  # +1 for space
-                    current_entity['text'] += ' ' + word['text']
-                    current_entity['end'] = word['end']
-                    current_entity['match'] = current_entity.get('match', current_entity['text'])
-                    current_entity['score'] = current_entity.get('score', 100)
-                else:
-                    combined_entities.append({
-                        'entity': current_entity['text'],
-                        'type': current_entity['type'],
-                        'source': current_entity['source'],
-                        'match': current_entity.get('match', current_entity['text']),
-                        'score': current_entity.get('score', 100)
-                    })
-                    current_entity = dict(word)
-            
-            # Add the last entity
+        for k, run_start in enumerate(run_starts):
+            run_end = run_starts[k + 1] if k + 1 < len(run_starts) else n_words
+            # Tokens in a run are adjacent in the source text, so the
+            # combined entity is a single slice instead of a join
             combined_entities.append({
-                'entity': current_entity['text'],
-                'type': current_entity['type'],
-                'source': current_entity['source'],
-                'match': current_entity.get('match', current_entity['text']),
-                'score': current_entity.get('score', 100)
+                'entity': text[tok_starts[run_start]:tok_ends[run_end - 1]],
+                'type': _TYPE_LABELS[int(types[run_start])],
+                'source': _SOURCE_LABELS[int(sources[run_start])],
+                'match': match_words[run_start],
+                'score': match_scores[run_start]
             })
-        
+
         return combined_entities
     
-    def _build_fuzzy_index(self, words: List[str]) -> Dict[str, Set[str]]:
-        """Build an index of words by their first two letters for faster fuzzy matching."""
-        index = defaultdict(set)
+    def _build_fuzzy_index(self, words: List[str]) -> Dict[str, Dict[int, Set[str]]]:
+        """Build an index of words bucketed by first two letters, then length.
+
+        Length bucketing lets lookups touch only the buckets within the
+        allowed length difference instead of filtering every candidate.
+        """
+        index = defaultdict(lambda: defaultdict(set))
         for word in words:
             word_lower = word.lower()
             if len(word_lower) >= 2:
                 key = word_lower[:2]
-                index[key].add(word_lower)
-        return index
+                index[key][len(word_lower)].add(word_lower)
+        # Plain dicts so the index stays picklable for the gazetteer cache
+        return {key: dict(buckets) for key, buckets in index.items()}
+
+    def _get_fuzzy_candidates(self, text_lower: str, index: Dict[str, Dict[int, Set[str]]]) -> List[str]:
+        """Collect candidates sharing the first two letters within length +/-2."""
+        buckets = index.get(text_lower[:2])
+        if not buckets:
+            return []
+        length = len(text_lower)
+        candidates = []
+        for bucket_length in range(length - 2, length + 3):
+            bucket = buckets.get(bucket_length)
+            if bucket:
+                candidates.extend(bucket)
+        return candidates
     
-    def _get_fuzzy_matches(self, text: str, word_set: Set[str], index: Dict[str, Set[str]]) -> List[str]:
-        """Find fuzzy matches for the given text in the word set using the index."""
+    def _max_edit_distance(self, text_lower: str) -> int:
+        """Levenshtein distance bound implied by the similarity threshold.
+
+        fuzz.ratio >= threshold requires an indel distance of at most
+        lensum * (100 - threshold) / 100, Levenshtein distance never
+        exceeds indel distance, and candidates are within +/-2 of the
+        query length, so this bound cannot reject a qualifying candidate.
+        """
+        lensum = 2 * len(text_lower) + 2
+        return (lensum * (100 - self.fuzzy_threshold)) // 100
+
+    def _get_fuzzy_matches(self, text: str, word_set: Set[str], index: Dict[str, Dict[int, Set[str]]]) -> List[Tuple[str, float]]:
+        """Find fuzzy matches for the given text as (word, score) tuples using the index."""
         text_lower = text.lower()
         if len(text_lower) < 2:
             return []
-            
+
         # Check exact match first
         if text_lower in word_set:
-            return [text_lower]
-            
-        # Get potential matches using the first two letters
-        key = text_lower[:2]
-        potential_matches = index.get(key, set())
-        
-        # Find matches above threshold
+            return [(text_lower, 100.0)]
+
+        # Get potential matches from the feasible (prefix, length) buckets
+        potential_matches = self._get_fuzzy_candidates(text_lower, index)
+
+        # Bounded edit distance lets the DP abort early on clear misses;
+        # only the few survivors get a full ratio score
+        max_dist = self._max_edit_distance(text_lower)
+        results = process.extract(text_lower, potential_matches,
+                                  scorer=Levenshtein.distance,
+                                  score_cutoff=max_dist,
+                                  limit=None)
+
         matches = []
-        for word in potential_matches:
-            if abs(len(word) - len(text_lower)) > 2:  # Skip if lengths differ by more than 2
-                continue
-            ratio = fuzz.ratio(text_lower, word)
-            if ratio >= self.fuzzy_threshold:
-                matches.append(word)
-        
+        for word, _, _ in results:
+            score = fuzz.ratio(text_lower, word)
+            if score >= self.fuzzy_threshold:
+                matches.append((word, score))
         return matches
+
+    def _get_best_fuzzy_match(self, text: str, word_set: Set[str], index: Dict[str, Dict[int, Set[str]]]) -> Tuple[str, float]:
+        """Find the single best fuzzy match as (word, score), or (None, 0) if none qualifies."""
+        text_lower = text.lower()
+        if len(text_lower) < 2:
+            return None, 0.0
+
+        # Check exact match first
+        if text_lower in word_set:
+            return text_lower, 100.0
+
+        # Get potential matches from the feasible (prefix, length) buckets
+        potential_matches = self._get_fuzzy_candidates(text_lower, index)
+
+        # Bounded edit distance prunes clear misses with an early-exit DP,
+        # then only the few survivors are ranked by full ratio
+        max_dist = self._max_edit_distance(text_lower)
+        survivors = process.extract(text_lower, potential_matches,
+                                    scorer=Levenshtein.distance,
+                                    score_cutoff=max_dist,
+                                    limit=None)
+
+        best_match, best_score = None, 0.0
+        for word, _, _ in survivors:
+            score = fuzz.ratio(text_lower, word)
+            if score >= self.fuzzy_threshold and score > best_score:
+                best_match, best_score = word, score
+        return best_match, best_score
     
     def is_location(self, text: str) -> bool:
         """Check if the given text is a known location with fuzzy matching."""
@@ -296,11 +466,8 @@ class LocationNER:
                     continue
                 
                 # Check for fuzzy matches
-                fuzzy_matches = self._get_fuzzy_matches(phrase, self.locations_set, self.locations_index)
-                if fuzzy_matches:
-                    # Get the best match
-                    best_match = max(fuzzy_matches, key=lambda x: fuzz.ratio(phrase_lower, x))
-                    score = fuzz.ratio(phrase_lower, best_match)
+                best_match, score = self._get_best_fuzzy_match(phrase, self.locations_set, self.locations_index)
+                if best_match:
                     entities.append({
                         'entity': phrase,
                         'type': 'LOC',
@@ -331,11 +498,8 @@ class LocationNER:
                 continue
                 
             # Check for fuzzy matches
-            fuzzy_matches = self._get_fuzzy_matches(word, self.types_set, self.types_index)
-            if fuzzy_matches:
-                # Get the best match
-                best_match = max(fuzzy_matches, key=lambda x: fuzz.ratio(word_lower, x))
-                score = fuzz.ratio(word_lower, best_match)
+            best_match, score = self._get_best_fuzzy_match(word, self.types_set, self.types_index)
+            if best_match:
                 entities.append({
                     'entity': word,
                     'type': 'TYPE',